@@ -77,14 +77,7 @@ class Card:
 
     @staticmethod
     def empty_copy(card):
-        class Empty(Card):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = type(card)
-
-        return new_copy
+        return object.__new__(type(card))
 
     @staticmethod
     def mockup_card():
@@ -14,7 +14,7 @@ class PlayerOrder(IntEnum):
     SECOND = 1
 
     def opposing(self):
-        return PlayerOrder((self + 1) % 2)
+        return _OPPOSING_PLAYER[self]
 
 
 class Lane(IntEnum):
@@ -22,7 +22,11 @@ class Lane(IntEnum):
     RIGHT = 1
 
     def opposing(self):
-        return Lane((self + 1) % 2)
+        return _OPPOSING_LANE[self]
+
+
+_OPPOSING_PLAYER = (PlayerOrder.SECOND, PlayerOrder.FIRST)
+_OPPOSING_LANE = (Lane.RIGHT, Lane.LEFT)
 
 
 class ActionType(Enum):
@@ -78,7 +78,7 @@ class State:
 
     @property
     def opposing_player(self) -> Player:
-        return self.players[(int(self._current_player) + 1) % 2]
+        return self.players[self._current_player.opposing()]
 
     @property
     def available_actions(self) -> Tuple[Action]:
@@ -255,14 +255,7 @@ class State:
 
     @staticmethod
     def empty_copy():
-        class Empty(State):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = State
-
-        return new_copy
+        return object.__new__(State)
 
     @staticmethod
     def from_native_input(game_input, deck_orders=((), ())):
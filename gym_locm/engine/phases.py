@@ -88,14 +88,7 @@ class Phase(ABC):
 
     @staticmethod
     def empty_copy(of_class):
-        class Empty(of_class):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = of_class
-
-        return new_copy
+        return object.__new__(of_class)
 
 
 class DeckBuildingPhase(Phase, ABC):
@@ -216,11 +209,14 @@ class ConstructedPhase(DeckBuildingPhase):
         self._choices = [0] * self.k, [0] * self.k
 
     def available_actions(self) -> Tuple[Action]:
-        return tuple(
-            Action(ActionType.CHOOSE, i)
-            for i, can_be_chosen in enumerate(self.action_mask())
-            if can_be_chosen
-        )
+        if self._available_actions is None:
+            self._available_actions = tuple(
+                Action(ActionType.CHOOSE, i)
+                for i, can_be_chosen in enumerate(self.action_mask())
+                if can_be_chosen
+            )
+
+        return self._available_actions
 
     def action_mask(self) -> Tuple[bool]:
         return tuple(self._action_mask[self._current_player])
@@ -280,6 +276,9 @@ class ConstructedPhase(DeckBuildingPhase):
         card = self._constructed_cards[chosen_card_index]
         self.state.players[self._current_player].deck.append(card)
 
+        # invalidate cached available actions
+        self._available_actions = None
+
         # trigger next turn
         self._next_turn()
 
@@ -1,4 +1,5 @@
 import argparse
+import math
 import os
 import pickle
 import sys
@@ -94,6 +95,19 @@ def get_arg_parser():
     return p
 
 
+def largest_divisor(n, upper_bound):
+    # divisors come in pairs (i, n // i), so checking up to sqrt(n) suffices
+    best = 1
+
+    for i in range(1, int(math.sqrt(n)) + 1):
+        if n % i == 0:
+            for divisor in (i, n // i):
+                if best < divisor <= upper_bound:
+                    best = divisor
+
+    return best
+
+
 def load_run(path):
     # tries to load past trials
     try:
@@ -178,15 +192,11 @@ if __name__ == "__main__":
         model_params["nminibatches"] = int(model_params["nminibatches"])
         model_params["noptepochs"] = int(model_params["noptepochs"])
 
-        # ensure nminibatches <= n_steps
-        model_params["nminibatches"] = min(
-            model_params["nminibatches"], model_params["n_steps"]
+        # ensure nminibatches <= n_steps and n_steps % nminibatches == 0
+        model_params["nminibatches"] = largest_divisor(
+            model_params["n_steps"], model_params["nminibatches"]
         )
 
-        # ensure n_steps % nminibatches == 0
-        while model_params["n_steps"] % model_params["nminibatches"] != 0:
-            model_params["nminibatches"] -= 1
-
         _counter += 1
         trial_id = _counter
 
@@ -4,7 +4,7 @@ import io
 import sys
 from datetime import datetime
 from pstats import Stats
-from multiprocessing import Pool, Manager, Lock
+from multiprocessing import get_context
 
 from gym_locm import agents, engine
 from gym_locm.agents import (
@@ -13,8 +13,7 @@ from gym_locm.agents import (
     parse_constructed_agent,
 )
 
-wins_by_p0 = Manager().list([0, 0])
-lock = Lock()
+_worker_args = None
 
 
 def get_arg_parser():
@@ -91,8 +90,14 @@ def get_arg_parser():
     return p
 
 
-def evaluate(params):
-    game_id, player_1, player_2, seed, silent, log_battles, version = params
+def init_worker(player_1, player_2, seed, log_battles, version):
+    global _worker_args
+
+    _worker_args = player_1, player_2, seed, log_battles, version
+
+
+def evaluate(game_id):
+    player_1, player_2, seed, log_battles, version = _worker_args
 
     deck_building_bots = (player_1[0], player_2[0])
     battle_bots = (player_1[1], player_2[1])
@@ -117,27 +122,31 @@ def evaluate(params):
 
         game.act(action)
 
-    with lock:
-        wins_by_p0[0] += 1 if game.winner == engine.PlayerOrder.FIRST else 0
-        wins_by_p0[1] += 1
+    return game.winner, battle_states
+
 
-        wins, games = wins_by_p0
+def collect(results, silent, log_battles):
+    wins, games = 0, 0
+
+    for winner, battle_states in results:
+        wins += 1 if winner == engine.PlayerOrder.FIRST else 0
+        games += 1
 
         if log_battles:
             for player in list(engine.PlayerOrder):
                 for battle_state in battle_states[player]:
-                    print(1 if game.winner == player else 0)
+                    print(1 if winner == player else 0)
                     print(battle_state)
 
-    ratio = 100 * wins / games
+        if not silent:
+            ratio = 100 * wins / games
 
-    if not silent:
-        print(
-            f"{datetime.now()} Episode {games}: "
-            f"{'%.2f' % ratio}% {'%.2f' % (100 - ratio)}%"
-        )
+            print(
+                f"{datetime.now()} Episode {games}: "
+                f"{'%.2f' % ratio}% {'%.2f' % (100 - ratio)}%"
+            )
 
-    return game.winner
+    return wins, games
 
 
 def run():
@@ -186,24 +195,19 @@ def run():
     player_2[0].seed(args.seed)
     player_2[1].seed(args.seed)
 
+    worker_args = player_1, player_2, args.seed, args.log_battles, args.version
+
     if args.profile:
         profiler = cProfile.Profile()
         result = io.StringIO()
 
+        init_worker(*worker_args)
+
         profiler.enable()
 
-        for i in range(args.games):
-            evaluate(
-                (
-                    i,
-                    player_1,
-                    player_2,
-                    args.seed,
-                    args.silent,
-                    args.log_battles,
-                    args.version,
-                )
-            )
+        results = map(evaluate, range(args.games))
+
+        wins, games = collect(results, args.silent, args.log_battles)
 
         profiler.disable()
 
@@ -214,23 +218,19 @@ def run():
 
         print(result.getvalue())
     else:
-        params = (
-            (
-                j,
-                player_1,
-                player_2,
-                args.seed,
-                args.silent,
-                args.log_battles,
-                args.version,
-            )
-            for j in range(args.games)
+        # agents are sent once per worker instead of once per game
+        pool = get_context("spawn").Pool(
+            args.processes, initializer=init_worker, initargs=worker_args
         )
+        chunksize = max(1, args.games // (args.processes * 4))
+
+        with pool:
+            results = pool.imap_unordered(
+                evaluate, range(args.games), chunksize=chunksize
+            )
 
-        with Pool(args.processes) as pool:
-            pool.map(evaluate, params)
+            wins, games = collect(results, args.silent, args.log_battles)
 
-    wins, games = wins_by_p0
     ratio = 100 * wins / games
 
     print(f"{'%.2f' % ratio}% {'%.2f' % (100 - ratio)}%")
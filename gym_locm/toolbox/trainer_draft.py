@@ -320,8 +320,13 @@ class SelfPlay(TrainingSession):
 
         # set adversary models as adversary policies of the self-play envs
         def make_adversary_policy(model, env):
+            # only the first row is ever written, so the buffer can be reused
+            zero_completed_obs = np.zeros(
+                (num_envs,) + env.observation_space.shape,
+                dtype=env.observation_space.dtype,
+            )
+
             def adversary_policy(obs):
-                zero_completed_obs = np.zeros((num_envs,) + env.observation_space.shape)
                 zero_completed_obs[0, :] = obs
 
                 actions, _ = model.adversary.predict(zero_completed_obs)
@@ -582,8 +587,13 @@ class AsymmetricSelfPlay(TrainingSession):
 
         # set adversary models as adversary policies of the self-play envs
         def make_adversary_policy(model, env):
+            # only the first row is ever written, so the buffer can be reused
+            zero_completed_obs = np.zeros(
+                (num_envs,) + env.observation_space.shape,
+                dtype=env.observation_space.dtype,
+            )
+
             def adversary_policy(obs):
-                zero_completed_obs = np.zeros((num_envs,) + env.observation_space.shape)
                 zero_completed_obs[0, :] = obs
 
                 actions, _ = model.adversary.predict(zero_completed_obs)